@@ -26,17 +26,22 @@ private:
     size_t snapshot_count_;
     bool is_initialized_;
     
+    int64_t cached_seconds_;
+    bool has_cached_seconds_;
+    std::string cached_seconds_prefix_;
+    
     static constexpr size_t BUFFER_SIZE = 64 * 1024;
     
     void flushBuffer();
     void appendToBuffer(const std::string& data);
     void appendToBuffer(const char* data, size_t length);
     
-    std::string formatTimestamp(const std::chrono::nanoseconds& timestamp) const;
-    std::string formatPrice(double price) const;
-    std::string formatSize(uint64_t size) const;
-    std::string formatCount(uint32_t count) const;
-    std::string buildCsvRow(const MbpSnapshot& snapshot, uint64_t row_index) const;
+    void appendNumber(uint64_t value);
+    void appendNumber(int64_t value);
+    void appendPrice(double price);
+    void appendCsvRow(const MbpSnapshot& snapshot, uint64_t row_index);
+    
+    void appendTimestamp(const std::chrono::nanoseconds& timestamp);
     
     static const char* CSV_HEADER;
 };
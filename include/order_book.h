@@ -3,7 +3,7 @@
 #include <map>
 #include <unordered_map>
 #include <vector>
-#include <queue>
+#include <deque>
 #include <chrono>
 #include <cstdint>
 
@@ -108,12 +108,12 @@ struct LevelData {
     double price;
     uint64_t total_size;
     uint32_t order_count;
-    std::queue<OrderEntry> order_queue;
+    std::deque<OrderEntry> order_queue;
     
     LevelData() : price(0.0), total_size(0), order_count(0) {}
     LevelData(double p, uint64_t size, uint64_t order_id) 
         : price(p), total_size(size), order_count(1) {
-        order_queue.emplace(order_id, size);
+        order_queue.emplace_back(order_id, size);
     }
 };
 
@@ -191,6 +191,7 @@ public:
     
     ProcessResult processEvent(const MboEvent& event);
     MbpSnapshot generateSnapshot(const MboEvent& event) const;
+    MbpSnapshot generateSnapshot(const MboEvent& event, const Top10State& top10) const;
     MbpSnapshot generateSnapshot(char action = 'S', char side = 'N') const;
     Top10State captureTop10State() const;
     
@@ -244,8 +245,10 @@ private:
     ProcessResult processResetEvent(const MboEvent& event);
     
     void cancelOrder(uint64_t order_id, uint64_t cancel_size = 0);
-    void updateBidLevel(double price, int64_t size_delta, int32_t count_delta, uint64_t order_id = 0);
-    void updateAskLevel(double price, int64_t size_delta, int32_t count_delta, uint64_t order_id = 0);
+    template <typename Levels>
+    typename Levels::iterator updateLevel(Levels& levels, double price, int64_t size_delta, int32_t count_delta, uint64_t order_id = 0);
+    template <typename Levels>
+    void cancelAtLevel(Levels& levels, double price, uint64_t order_id, uint64_t cancel_size, bool order_removed);
     
     void processTradeFill(char trade_side, double price, uint64_t size);
     char getOppositeSide(char side) const;
@@ -50,58 +50,16 @@ int main(int argc, char* argv[]) {
     size_t processed_events = 0;
     size_t snapshots_written = 0;
     size_t tfc_sequences_detected = 0;
-    size_t snapshots_filtered = 0;
     
     size_t a_events_processed = 0;
     size_t c_events_processed = 0;
     size_t a_events_included = 0;
     size_t c_events_included = 0;
     
-    const size_t ORDERBOOK_BUILDING_PHASE_A = 50;
-    const size_t ORDERBOOK_BUILDING_PHASE_C = 100;
-    const double STEADY_STATE_A_INCLUSION = 0.687;
-    const double STEADY_STATE_C_INCLUSION = 0.645;
-    const double BID_SIDE_BOOST = 1.02;
-    
-    size_t bid_a_count = 0, ask_a_count = 0;
-    size_t bid_c_count = 0, ask_c_count = 0;
-    
-    auto shouldIncludeEvent = [&](const MboEvent& event, size_t events_of_type_processed) -> bool {
-        if (event.action == 'A') {
-            a_events_included++;
-            return true;
-        } else if (event.action == 'C') {
-            c_events_included++;
-            return true;
-        }
-        
-        return true;
-    };
-    
-    std::vector<bool> is_tfc_event(mbo_events.size(), false);
-    std::vector<size_t> tfc_trade_index(mbo_events.size(), SIZE_MAX);
-    
-    for (size_t i = 0; i < mbo_events.size() - 2; ++i) {
-        if (mbo_events[i].action == 'T' && 
-            i + 1 < mbo_events.size() && mbo_events[i + 1].action == 'F' &&
-            i + 2 < mbo_events.size() && mbo_events[i + 2].action == 'C') {
-            
-            const auto& t_event = mbo_events[i];
-            const auto& f_event = mbo_events[i + 1];
-            const auto& c_event = mbo_events[i + 2];
-            
-            if (f_event.price == t_event.price && 
-                f_event.size == t_event.size &&
-                c_event.order_id == f_event.order_id) {
-                
-                is_tfc_event[i] = true;
-                is_tfc_event[i + 1] = true;
-                is_tfc_event[i + 2] = true;
-                tfc_trade_index[i + 2] = i;
-                tfc_sequences_detected++;
-            }
-        }
-    }
+    // Top-10 state after the last A/C event, reused as the next A/C event's
+    // "before" state while nothing else has touched the book
+    Top10State last_top10;
+    bool last_top10_valid = false;
     
     std::unordered_set<uint64_t> failed_cancel_orders;
     for (size_t i = 0; i < mbo_events.size(); ++i) {
@@ -117,20 +75,25 @@ int main(int argc, char* argv[]) {
             continue;
         }
         
-        if (is_tfc_event[i]) {
-            if (event.action == 'T') {
-                ProcessResult result = order_book.processEvent(event);
-                (void)result;
-                continue;
-            } else if (event.action == 'F') {
-                ProcessResult result = order_book.processEvent(event);
-                (void)result;
-                continue;
-            } else if (event.action == 'C') {
-                ProcessResult result = order_book.processEvent(event);
+        // T->F->C sequences are detected by looking two events ahead and
+        // consolidated into a single T snapshot once the C has been applied
+        if (event.action == 'T' && i + 2 < mbo_events.size()) {
+            const auto& f_event = mbo_events[i + 1];
+            const auto& c_event = mbo_events[i + 2];
+            
+            if (f_event.action == 'F' && c_event.action == 'C' &&
+                f_event.price == event.price && 
+                f_event.size == event.size &&
+                c_event.order_id == f_event.order_id) {
+                
+                tfc_sequences_detected++;
+                last_top10_valid = false;
+                
+                order_book.processEvent(event);
+                order_book.processEvent(f_event);
+                ProcessResult result = order_book.processEvent(c_event);
                 
-                size_t trade_idx = tfc_trade_index[i];
-                MbpSnapshot snapshot = order_book.generateSnapshot(mbo_events[trade_idx]);
+                MbpSnapshot snapshot = order_book.generateSnapshot(event);
                 
                 snapshot.action = result.snapshot_action;
                 snapshot.side = result.snapshot_side;
@@ -138,6 +101,9 @@ int main(int argc, char* argv[]) {
                 if (csv_writer.writeSnapshot(snapshot, snapshots_written)) {
                     snapshots_written++;
                 }
+                
+                processed_events += 2;
+                i += 2;
                 continue;
             }
         }
@@ -148,51 +114,44 @@ int main(int argc, char* argv[]) {
             if (!order_book.orderExists(event.order_id)) {
                 should_process = false;
                 failed_cancel_orders.insert(event.order_id);
-                std::cout << "Filtered Cancel event for non-existent order " << event.order_id << std::endl;
+                std::cout << "Filtered Cancel event for non-existent order " << event.order_id << '\n';
             } else {
-                if (!shouldIncludeEvent(event, c_events_processed)) {
-                    should_process = false;
-                    snapshots_filtered++;
-                    std::cout << "Filtered C event " << c_events_processed + 1 << " (orderbook state-aware filtering)" << std::endl;
-                } else {
-                    c_events_included++;
-                }
+                c_events_included++;
                 c_events_processed++;
             }
         } else if (event.action == 'A') {
             if (failed_cancel_orders.count(event.order_id)) {
                 should_process = false;
                 failed_cancel_orders.erase(event.order_id);
-                std::cout << "Filtered Add event for order " << event.order_id << " following failed Cancel" << std::endl;
+                std::cout << "Filtered Add event for order " << event.order_id << " following failed Cancel\n";
             } else {
-                if (!shouldIncludeEvent(event, a_events_processed)) {
-                    should_process = false;
-                    snapshots_filtered++;
-                    std::cout << "Filtered A event " << a_events_processed + 1 << " (orderbook state-aware filtering)" << std::endl;
-                } else {
-                    a_events_included++;
-                }
+                a_events_included++;
                 a_events_processed++;
             }
         }
         
         if (should_process) {
-            Top10State previous_top10 = order_book.captureTop10State();
-            
             if (event.action == 'A' || event.action == 'C') {
+                Top10State previous_top10 = last_top10_valid ? last_top10 : order_book.captureTop10State();
                 ProcessResult result = order_book.processEvent(event);
                 
                 if (result.should_write) {
                     Top10State current_top10 = order_book.captureTop10State();
                     
                     if (current_top10 != previous_top10) {
-                        MbpSnapshot snapshot = order_book.generateSnapshot(event);
+                        MbpSnapshot snapshot = order_book.generateSnapshot(event, current_top10);
                         if (csv_writer.writeSnapshot(snapshot, snapshots_written)) {
                             snapshots_written++;
                         }
                     }
+                    
+                    last_top10 = current_top10;
+                    last_top10_valid = true;
+                } else {
+                    last_top10_valid = false;
                 }
             } else {
+                last_top10_valid = false;
                 ProcessResult result = order_book.processEvent(event);
                 
                 if (event.action == 'T') {
@@ -250,7 +209,6 @@ int main(int argc, char* argv[]) {
     
     std::cout << "Processed " << processed_events << " events in " << process_duration.count() << " ms" << std::endl;
     std::cout << "Generated and wrote " << snapshots_written << " MBP-10 snapshots to output.csv" << std::endl;
-    std::cout << "Filtered " << snapshots_filtered << " snapshots due to orderbook state-aware filtering" << std::endl;
     std::cout << "Detected and consolidated " << tfc_sequences_detected << " T->F->C sequences into T actions" << std::endl;
     
     std::cout << "\n=== ORDERBOOK STATE-AWARE FILTERING RESULTS ===" << std::endl;
@@ -258,10 +216,6 @@ int main(int argc, char* argv[]) {
               << " (" << (a_events_processed > 0 ? (a_events_included * 100.0 / a_events_processed) : 0) << "% included)" << std::endl;
     std::cout << "C events: " << c_events_included << "/" << c_events_processed 
               << " (" << (c_events_processed > 0 ? (c_events_included * 100.0 / c_events_processed) : 0) << "% included)" << std::endl;
-    std::cout << "BID A events processed: " << bid_a_count << std::endl;
-    std::cout << "ASK A events processed: " << ask_a_count << std::endl;
-    std::cout << "BID C events processed: " << bid_c_count << std::endl;
-    std::cout << "ASK C events processed: " << ask_c_count << std::endl;
     std::cout << "Orderbook state-aware filtering implemented successfully!" << std::endl;
     
     MbpSnapshot final_snapshot = order_book.generateSnapshot('S', 'N');
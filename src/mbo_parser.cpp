@@ -3,11 +3,10 @@
 #include <iostream>
 #include <cstring>
 #include <cstdlib>
-#include <memory>
 
 std::vector<MboEvent> MboParser::parseFile(const std::string& filename) {
     std::vector<MboEvent> events;
-    std::ifstream file(filename);
+    std::ifstream file(filename, std::ios::binary);
     
     if (!file.is_open()) {
         std::cerr << "Error: Cannot open file " << filename << std::endl;
@@ -21,26 +20,51 @@ std::vector<MboEvent> MboParser::parseFile(const std::string& filename) {
     size_t estimated_lines = file_size / 100;
     events.reserve(estimated_lines);
     
-    std::string line;
-    bool is_header = true;
-    
+    // Read the file in large blocks and parse lines in place, avoiding a
+    // std::string allocation per row
     constexpr size_t BUFFER_SIZE = 65536;
-    auto buffer = std::make_unique<char[]>(BUFFER_SIZE);
-    file.rdbuf()->pubsetbuf(buffer.get(), BUFFER_SIZE);
+    std::vector<char> buffer(BUFFER_SIZE + 1);
+    size_t carry = 0;
+    bool is_header = true;
+    bool at_eof = false;
     
-    while (std::getline(file, line)) {
-        if (is_header) {
-            is_header = false;
-            continue;
-        }
+    while (!at_eof) {
+        size_t to_read = buffer.size() - 1 - carry;
+        file.read(buffer.data() + carry, static_cast<std::streamsize>(to_read));
+        size_t bytes = carry + static_cast<size_t>(file.gcount());
+        at_eof = static_cast<size_t>(file.gcount()) < to_read;
+        
+        char* line_start = buffer.data();
+        char* block_end = buffer.data() + bytes;
         
-        if (line.empty()) {
-            continue;
+        while (line_start < block_end) {
+            char* line_end = static_cast<char*>(std::memchr(line_start, '\n', block_end - line_start));
+            if (!line_end) {
+                if (!at_eof) break;
+                line_end = block_end;
+            }
+            *line_end = '\0';
+            
+            if (is_header) {
+                is_header = false;
+            } else if (line_end != line_start) {
+                MboEvent event;
+                if (parseLine(line_start, event)) {
+                    events.emplace_back(std::move(event));
+                }
+            }
+            
+            line_start = line_end + 1;
         }
         
-        MboEvent event;
-        if (parseLine(line.c_str(), event)) {
-            events.emplace_back(std::move(event));
+        if (at_eof) break;
+        
+        carry = (line_start < block_end) ? static_cast<size_t>(block_end - line_start) : 0;
+        if (carry == bytes) {
+            // A single line does not fit in the buffer; grow it
+            buffer.resize(buffer.size() * 2);
+        } else if (carry > 0) {
+            std::memmove(buffer.data(), line_start, carry);
         }
     }
     
@@ -127,52 +151,63 @@ bool MboParser::parseLine(const char* line, MboEvent& event) {
     return true;
 }
 
+static inline bool parseFixedDigits(const char* str, int count, int& value) {
+    value = 0;
+    for (int i = 0; i < count; ++i) {
+        if (str[i] < '0' || str[i] > '9') return false;
+        value = value * 10 + (str[i] - '0');
+    }
+    return true;
+}
+
 std::chrono::nanoseconds MboParser::parseTimestamp(const char* timestamp_str) {
     int year, month, day, hour, minute, second;
     uint64_t nanosec_part = 0;
-    
-    if (sscanf(timestamp_str, "%d-%d-%dT%d:%d:%d", 
-               &year, &month, &day, &hour, &minute, &second) != 6) {
-        return std::chrono::nanoseconds(0);
+    const char* dot_pos = nullptr;
+    
+    // Fast path for the fixed-width YYYY-MM-DDTHH:MM:SS layout of the feed;
+    // anything else falls back to sscanf
+    const char* ts = timestamp_str;
+    if (parseFixedDigits(ts, 4, year) && ts[4] == '-' &&
+        parseFixedDigits(ts + 5, 2, month) && ts[7] == '-' &&
+        parseFixedDigits(ts + 8, 2, day) && ts[10] == 'T' &&
+        parseFixedDigits(ts + 11, 2, hour) && ts[13] == ':' &&
+        parseFixedDigits(ts + 14, 2, minute) && ts[16] == ':' &&
+        parseFixedDigits(ts + 17, 2, second)) {
+        if (ts[19] == '.') {
+            dot_pos = ts + 19;
+        }
+    } else {
+        if (sscanf(timestamp_str, "%d-%d-%dT%d:%d:%d", 
+                   &year, &month, &day, &hour, &minute, &second) != 6) {
+            return std::chrono::nanoseconds(0);
+        }
+        dot_pos = strchr(timestamp_str, '.');
     }
     
-    const char* dot_pos = strchr(timestamp_str, '.');
     if (dot_pos) {
         dot_pos++;
         
-        char ns_buffer[10] = {0};
         int ns_digits = 0;
         
         while (ns_digits < 9 && dot_pos[ns_digits] >= '0' && dot_pos[ns_digits] <= '9') {
-            ns_buffer[ns_digits] = dot_pos[ns_digits];
+            nanosec_part = nanosec_part * 10 + static_cast<uint64_t>(dot_pos[ns_digits] - '0');
             ns_digits++;
         }
         
         while (ns_digits < 9) {
-            ns_buffer[ns_digits++] = '0';
-        }
-        
-        nanosec_part = strtoull(ns_buffer, nullptr, 10);
-    }
-    
-    static const int days_in_month[] = {31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
-    
-    int days_since_epoch = 0;
-    
-    for (int y = 1970; y < year; y++) {
-        bool is_leap = (y % 4 == 0 && y % 100 != 0) || (y % 400 == 0);
-        days_since_epoch += is_leap ? 366 : 365;
-    }
-    
-    bool is_leap_year = (year % 4 == 0 && year % 100 != 0) || (year % 400 == 0);
-    for (int m = 1; m < month; m++) {
-        days_since_epoch += days_in_month[m - 1];
-        if (m == 2 && is_leap_year) {
-            days_since_epoch += 1;
+            nanosec_part *= 10;
+            ns_digits++;
         }
     }
     
-    days_since_epoch += day - 1;
+    // Closed-form civil date to days-since-epoch (no per-year/per-month loops)
+    int y = year - (month <= 2 ? 1 : 0);
+    int era = (y >= 0 ? y : y - 399) / 400;
+    int year_of_era = y - era * 400;
+    int day_of_year = (153 * (month > 2 ? month - 3 : month + 9) + 2) / 5 + day - 1;
+    int day_of_era = year_of_era * 365 + year_of_era / 4 - year_of_era / 100 + day_of_year;
+    int days_since_epoch = era * 146097 + day_of_era - 719468;
     
     uint64_t total_seconds = static_cast<uint64_t>(days_since_epoch) * 86400ULL + 
                             hour * 3600ULL + minute * 60ULL + second;
@@ -191,12 +226,10 @@ uint64_t MboParser::fastParseUInt64(const char* str, char** endptr) {
 }
 
 const char* MboParser::skipToNextField(const char* ptr) {
-    while (*ptr && *ptr != ',') {
-        ptr++;
-    }
-    
-    if (*ptr == ',') {
-        return ptr + 1;
+    // Lines are NUL-terminated, so strchr stops at the end of the row
+    const char* comma = std::strchr(ptr, ',');
+    if (comma) {
+        return comma + 1;
     }
     
     return nullptr;
@@ -2,6 +2,7 @@
 #include <iostream>
 #include <iomanip>
 #include <sstream>
+#include <charconv>
 
 const char* MbpCsvWriter::CSV_HEADER = 
     ",ts_recv,ts_event,rtype,publisher_id,instrument_id,action,side,depth,price,size,flags,ts_in_delta,sequence,"
@@ -18,7 +19,8 @@ const char* MbpCsvWriter::CSV_HEADER =
     "symbol,order_id";
 
 MbpCsvWriter::MbpCsvWriter(const std::string& filename)
-    : filename_(filename), snapshot_count_(0), is_initialized_(false) {
+    : filename_(filename), snapshot_count_(0), is_initialized_(false),
+      cached_seconds_(0), has_cached_seconds_(false) {
     write_buffer_.reserve(BUFFER_SIZE);
 }
 
@@ -50,9 +52,7 @@ bool MbpCsvWriter::writeSnapshot(const MbpSnapshot& snapshot, uint64_t row_index
         return false;
     }
     
-    std::string csv_row = buildCsvRow(snapshot, row_index);
-    appendToBuffer(csv_row);
-    appendToBuffer("\n");
+    appendCsvRow(snapshot, row_index);
     
     snapshot_count_++;
     
@@ -93,78 +93,99 @@ void MbpCsvWriter::appendToBuffer(const char* data, size_t length) {
     write_buffer_.insert(write_buffer_.end(), data, data + length);
 }
 
-std::string MbpCsvWriter::formatTimestamp(const std::chrono::nanoseconds& timestamp) const {
-    auto time_point = std::chrono::system_clock::time_point(
-        std::chrono::duration_cast<std::chrono::system_clock::duration>(timestamp)
-    );
-    
-    auto time_t_val = std::chrono::system_clock::to_time_t(time_point);
-    
+void MbpCsvWriter::appendTimestamp(const std::chrono::nanoseconds& timestamp) {
     auto duration_since_epoch = timestamp;
     auto seconds_since_epoch = std::chrono::duration_cast<std::chrono::seconds>(duration_since_epoch);
     auto nanoseconds_part = duration_since_epoch - seconds_since_epoch;
     
-    std::ostringstream oss;
-    oss << std::put_time(std::gmtime(&time_t_val), "%Y-%m-%dT%H:%M:%S");
-    oss << "." << std::setfill('0') << std::setw(9) << nanoseconds_part.count() << "Z";
+    // Consecutive snapshots usually fall in the same second, so the
+    // date/time prefix is only rebuilt when the second changes
+    if (!has_cached_seconds_ || seconds_since_epoch.count() != cached_seconds_) {
+        auto time_point = std::chrono::system_clock::time_point(
+            std::chrono::duration_cast<std::chrono::system_clock::duration>(timestamp)
+        );
+        
+        auto time_t_val = std::chrono::system_clock::to_time_t(time_point);
+        
+        std::ostringstream oss;
+        oss << std::put_time(std::gmtime(&time_t_val), "%Y-%m-%dT%H:%M:%S");
+        cached_seconds_prefix_ = oss.str();
+        cached_seconds_ = seconds_since_epoch.count();
+        has_cached_seconds_ = true;
+    }
+    
+    char fraction[11];
+    fraction[0] = '.';
+    uint64_t nanos = static_cast<uint64_t>(nanoseconds_part.count());
+    for (int i = 9; i >= 1; --i) {
+        fraction[i] = static_cast<char>('0' + nanos % 10);
+        nanos /= 10;
+    }
+    fraction[10] = 'Z';
     
-    return oss.str();
+    appendToBuffer(cached_seconds_prefix_);
+    appendToBuffer(fraction, sizeof(fraction));
 }
 
-std::string MbpCsvWriter::formatPrice(double price) const {
+void MbpCsvWriter::appendPrice(double price) {
     if (price == 0.0) {
-        return "";
+        return;
     }
     
-    std::ostringstream oss;
-    oss << std::fixed << std::setprecision(2) << price;
-    std::string result = oss.str();
+    // to_chars with fixed precision rounds exactly like "%.2f" without
+    // going through a locale-aware stream
+    char digits[32];
+    auto result = std::to_chars(digits, digits + sizeof(digits), price, std::chars_format::fixed, 2);
+    size_t length = static_cast<size_t>(result.ptr - digits);
     
-    if (result.find('.') != std::string::npos) {
-        if (result.substr(result.length() - 3) == ".00") {
-            result = result.substr(0, result.length() - 1);
-        }
-        else if (result.back() == '0' && result[result.length()-2] != '.') {
-            result.pop_back();
+    if (length >= 3 && digits[length - 3] == '.') {
+        // "x.00" -> "x.0", "x.50" -> "x.5"
+        if (digits[length - 1] == '0') {
+            length--;
         }
     }
     
-    return result;
+    appendToBuffer(digits, length);
 }
 
-std::string MbpCsvWriter::formatSize(uint64_t size) const {
-    if (size == 0) {
-        return "0";
-    }
-    return std::to_string(size);
+void MbpCsvWriter::appendNumber(uint64_t value) {
+    char digits[24];
+    auto result = std::to_chars(digits, digits + sizeof(digits), value);
+    appendToBuffer(digits, static_cast<size_t>(result.ptr - digits));
 }
 
-std::string MbpCsvWriter::formatCount(uint32_t count) const {
-    if (count == 0) {
-        return "0";
-    }
-    return std::to_string(count);
+void MbpCsvWriter::appendNumber(int64_t value) {
+    char digits[24];
+    auto result = std::to_chars(digits, digits + sizeof(digits), value);
+    appendToBuffer(digits, static_cast<size_t>(result.ptr - digits));
 }
 
-std::string MbpCsvWriter::buildCsvRow(const MbpSnapshot& snapshot, uint64_t row_index) const {
-    std::ostringstream row;
-    
-    std::string timestamp_str = formatTimestamp(snapshot.timestamp);
-    
-    row << row_index << ","
-        << timestamp_str << ","
-        << timestamp_str << ","
-        << "10,"
-        << "2,"
-        << "1108,"
-        << snapshot.action << ","
-        << snapshot.side << ","
-        << snapshot.depth << ","
-        << (snapshot.event_price > 0 ? formatPrice(snapshot.event_price) : "") << ","
-        << snapshot.event_size << ","
-        << static_cast<int>(snapshot.event_flags) << ","
-        << snapshot.event_ts_in_delta << ","
-        << snapshot.sequence_number << ",";
+void MbpCsvWriter::appendCsvRow(const MbpSnapshot& snapshot, uint64_t row_index) {
+    // Fields are appended straight into the write buffer; no per-row stream
+    appendNumber(row_index);
+    appendToBuffer(",", 1);
+    appendTimestamp(snapshot.timestamp);
+    appendToBuffer(",", 1);
+    appendTimestamp(snapshot.timestamp);
+    appendToBuffer(",10,2,1108,", 11);
+    appendToBuffer(&snapshot.action, 1);
+    appendToBuffer(",", 1);
+    appendToBuffer(&snapshot.side, 1);
+    appendToBuffer(",", 1);
+    appendNumber(static_cast<int64_t>(snapshot.depth));
+    appendToBuffer(",", 1);
+    if (snapshot.event_price > 0) {
+        appendPrice(snapshot.event_price);
+    }
+    appendToBuffer(",", 1);
+    appendNumber(snapshot.event_size);
+    appendToBuffer(",", 1);
+    appendNumber(static_cast<uint64_t>(snapshot.event_flags));
+    appendToBuffer(",", 1);
+    appendNumber(static_cast<int64_t>(snapshot.event_ts_in_delta));
+    appendToBuffer(",", 1);
+    appendNumber(snapshot.sequence_number);
+    appendToBuffer(",", 1);
     
     const double* bid_prices = &snapshot.bid_px_00;
     const uint64_t* bid_sizes = &snapshot.bid_sz_00;
@@ -175,20 +196,25 @@ std::string MbpCsvWriter::buildCsvRow(const MbpSnapshot& snapshot, uint64_t row_
     const uint32_t* ask_counts = &snapshot.ask_ct_00;
     
     for (int i = 0; i < 10; ++i) {
-        row << formatPrice(bid_prices[i]) << ","
-            << formatSize(bid_sizes[i]) << ","
-            << formatCount(bid_counts[i]) << ",";
-            
-        row << formatPrice(ask_prices[i]) << ","
-            << formatSize(ask_sizes[i]) << ","
-            << formatCount(ask_counts[i]);
-            
+        appendPrice(bid_prices[i]);
+        appendToBuffer(",", 1);
+        appendNumber(bid_sizes[i]);
+        appendToBuffer(",", 1);
+        appendNumber(static_cast<uint64_t>(bid_counts[i]));
+        appendToBuffer(",", 1);
+        
+        appendPrice(ask_prices[i]);
+        appendToBuffer(",", 1);
+        appendNumber(ask_sizes[i]);
+        appendToBuffer(",", 1);
+        appendNumber(static_cast<uint64_t>(ask_counts[i]));
+        
         if (i < 9) {
-            row << ",";
+            appendToBuffer(",", 1);
         }
     }
     
-    row << ",ARL," << snapshot.event_order_id;
-    
-    return row.str();
+    appendToBuffer(",ARL,", 5);
+    appendNumber(snapshot.event_order_id);
+    appendToBuffer("\n", 1);
 }
@@ -51,27 +51,7 @@ ProcessResult OrderBook::processCancelEvent(const MboEvent& event) {
     }
 
     if (last_fill_was_trade_ && trade_state_ == TradeState::EXPECTING_FILL) {
-        char target_side = getOppositeSide(pending_trade_side_);
-        double trade_price = pending_trade_price_;
-        uint64_t trade_size = pending_trade_size_;
-        
-        if (target_side == 'B') {
-            auto level_it = bid_levels_.find(trade_price);
-            if (level_it != bid_levels_.end()) {
-                fillOrdersAtLevel(level_it->second, trade_size, target_side);
-                if (level_it->second.total_size == 0) {
-                    bid_levels_.erase(level_it);
-                }
-            }
-        } else if (target_side == 'A') {
-            auto level_it = ask_levels_.find(trade_price);
-            if (level_it != ask_levels_.end()) {
-                fillOrdersAtLevel(level_it->second, trade_size, target_side);
-                if (level_it->second.total_size == 0) {
-                    ask_levels_.erase(level_it);
-                }
-            }
-        }
+        processTradeFill(pending_trade_side_, pending_trade_price_, pending_trade_size_);
         
         char filled_side = pending_actual_trade_side_;
         
@@ -134,23 +114,70 @@ ProcessResult OrderBook::processResetEvent(const MboEvent& event) {
     return {true, 'R', 'N'};
 }
 
+// Bid and ask books differ only in ordering, so level maintenance is shared
+// Returns the level the price now maps to, or levels.end() if none remains
+template <typename Levels>
+typename Levels::iterator OrderBook::updateLevel(Levels& levels, double price, int64_t size_delta, int32_t count_delta, uint64_t order_id) {
+    auto it = levels.lower_bound(price);
+    
+    if (it == levels.end() || it->first != price) {
+        if (size_delta > 0) {
+            // Insert at the lower_bound position instead of looking the price up again
+            auto inserted = levels.emplace_hint(it, price, LevelData(price, static_cast<uint64_t>(size_delta), order_id));
+            inserted->second.order_count = static_cast<uint32_t>(count_delta);
+            return inserted;
+        }
+        return levels.end();
+    } else {
+        it->second.total_size = static_cast<uint64_t>(
+            static_cast<int64_t>(it->second.total_size) + size_delta);
+        it->second.order_count = static_cast<uint32_t>(
+            static_cast<int32_t>(it->second.order_count) + count_delta);
+        
+        if (count_delta > 0 && order_id != 0) {
+            it->second.order_queue.emplace_back(order_id, static_cast<uint64_t>(size_delta));
+        }
+        
+        if (it->second.total_size == 0 || it->second.order_count == 0) {
+            levels.erase(it);
+            return levels.end();
+        }
+        return it;
+    }
+}
+
+template <typename Levels>
+void OrderBook::cancelAtLevel(Levels& levels, double price, uint64_t order_id, uint64_t cancel_size, bool order_removed) {
+    // Resolve the price level once and apply size, queue and count changes to it
+    auto level_it = levels.find(price);
+    if (level_it == levels.end()) {
+        return;
+    }
+    
+    LevelData& level = level_it->second;
+    level.total_size -= cancel_size;
+    updateOrderInQueue(level, order_id, cancel_size);
+    if (order_removed) {
+        level.order_count--;
+    }
+    if (level.total_size == 0 || level.order_count == 0) {
+        levels.erase(level_it);
+    }
+}
+
 void OrderBook::addOrder(uint64_t order_id, double price, uint64_t size, char side) {
-    OrderData order_data(price, size, side);
-    orders_[order_id] = order_data;
+    OrderData& order = orders_[order_id];
+    order = OrderData(price, size, side);
     
     if (side == 'B') {
-        updateBidLevel(price, static_cast<int64_t>(size), 1, order_id);
-        
-        auto level_it = bid_levels_.find(price);
+        auto level_it = updateLevel(bid_levels_, price, static_cast<int64_t>(size), 1, order_id);
         if (level_it != bid_levels_.end()) {
-            orders_[order_id].level_iterator = &(*level_it);
+            order.level_iterator = &(*level_it);
         }
     } else if (side == 'A') {
-        updateAskLevel(price, static_cast<int64_t>(size), 1, order_id);
-        
-        auto level_it = ask_levels_.find(price);
+        auto level_it = updateLevel(ask_levels_, price, static_cast<int64_t>(size), 1, order_id);
         if (level_it != ask_levels_.end()) {
-            orders_[order_id].level_iterator = &(*level_it);
+            order.level_iterator = &(*level_it);
         }
     }
 }
@@ -164,83 +191,27 @@ void OrderBook::cancelOrder(uint64_t order_id, uint64_t cancel_size) {
     OrderData& order = it->second;
     uint64_t actual_cancel_size = (cancel_size == 0) ? order.size : std::min(cancel_size, order.size);
     
-    // Update price levels - reduce size but don't change order count yet
+    // Update order size
+    order.size -= actual_cancel_size;
+    bool order_removed = (order.size == 0);
+    
     if (order.side == 'B') {
-        updateBidLevel(order.price, -static_cast<int64_t>(actual_cancel_size), 0, 0);
-        // Also update the order in the queue
-        updateOrderInQueue(bid_levels_[order.price], order_id, actual_cancel_size);
+        cancelAtLevel(bid_levels_, order.price, order_id, actual_cancel_size, order_removed);
     } else if (order.side == 'A') {
-        updateAskLevel(order.price, -static_cast<int64_t>(actual_cancel_size), 0, 0);
-        // Also update the order in the queue
-        updateOrderInQueue(ask_levels_[order.price], order_id, actual_cancel_size);
+        cancelAtLevel(ask_levels_, order.price, order_id, actual_cancel_size, order_removed);
     }
     
-    // Update order size
-    order.size -= actual_cancel_size;
-    
     // If order size becomes zero, remove the order completely
-    if (order.size == 0) {
-        // Decrement order count at the price level
-        if (order.side == 'B') {
-            updateBidLevel(order.price, 0, -1, 0);
-        } else if (order.side == 'A') {
-            updateAskLevel(order.price, 0, -1, 0);
-        }
-        
-        // Remove from orders map
+    if (order_removed) {
         orders_.erase(it);
     }
 }
 
-void OrderBook::updateBidLevel(double price, int64_t size_delta, int32_t count_delta, uint64_t order_id) {
-    auto it = bid_levels_.find(price);
-    
-    if (it == bid_levels_.end()) {
-        if (size_delta > 0) {
-            bid_levels_[price] = LevelData(price, static_cast<uint64_t>(size_delta), order_id);
-            bid_levels_[price].order_count = static_cast<uint32_t>(count_delta);
-        }
-    } else {
-        it->second.total_size = static_cast<uint64_t>(
-            static_cast<int64_t>(it->second.total_size) + size_delta);
-        it->second.order_count = static_cast<uint32_t>(
-            static_cast<int32_t>(it->second.order_count) + count_delta);
-        
-        if (count_delta > 0 && order_id != 0) {
-            it->second.order_queue.emplace(order_id, static_cast<uint64_t>(size_delta));
-        }
-        
-        if (it->second.total_size == 0 || it->second.order_count == 0) {
-            bid_levels_.erase(it);
-        }
-    }
-}
-
-void OrderBook::updateAskLevel(double price, int64_t size_delta, int32_t count_delta, uint64_t order_id) {
-    auto it = ask_levels_.find(price);
-    
-    if (it == ask_levels_.end()) {
-        if (size_delta > 0) {
-            ask_levels_[price] = LevelData(price, static_cast<uint64_t>(size_delta), order_id);
-            ask_levels_[price].order_count = static_cast<uint32_t>(count_delta);
-        }
-    } else {
-        it->second.total_size = static_cast<uint64_t>(
-            static_cast<int64_t>(it->second.total_size) + size_delta);
-        it->second.order_count = static_cast<uint32_t>(
-            static_cast<int32_t>(it->second.order_count) + count_delta);
-        
-        if (count_delta > 0 && order_id != 0) {
-            it->second.order_queue.emplace(order_id, static_cast<uint64_t>(size_delta));
-        }
-        
-        if (it->second.total_size == 0 || it->second.order_count == 0) {
-            ask_levels_.erase(it);
-        }
-    }
+MbpSnapshot OrderBook::generateSnapshot(const MboEvent& event) const {
+    return generateSnapshot(event, captureTop10State());
 }
 
-MbpSnapshot OrderBook::generateSnapshot(const MboEvent& event) const {
+MbpSnapshot OrderBook::generateSnapshot(const MboEvent& event, const Top10State& top10) const {
     MbpSnapshot snapshot;
     snapshot.sequence_number = event.sequence;
     snapshot.action = event.action;
@@ -253,46 +224,22 @@ MbpSnapshot OrderBook::generateSnapshot(const MboEvent& event) const {
     snapshot.event_flags = event.flags;
     snapshot.event_ts_in_delta = event.ts_in_delta;
     
-    double* bid_prices[] = {&snapshot.bid_px_00, &snapshot.bid_px_01, &snapshot.bid_px_02, &snapshot.bid_px_03, &snapshot.bid_px_04,
-                           &snapshot.bid_px_05, &snapshot.bid_px_06, &snapshot.bid_px_07, &snapshot.bid_px_08, &snapshot.bid_px_09};
-    
-    uint64_t* bid_sizes[] = {&snapshot.bid_sz_00, &snapshot.bid_sz_01, &snapshot.bid_sz_02, &snapshot.bid_sz_03, &snapshot.bid_sz_04,
-                            &snapshot.bid_sz_05, &snapshot.bid_sz_06, &snapshot.bid_sz_07, &snapshot.bid_sz_08, &snapshot.bid_sz_09};
-    
-    uint32_t* bid_counts[] = {&snapshot.bid_ct_00, &snapshot.bid_ct_01, &snapshot.bid_ct_02, &snapshot.bid_ct_03, &snapshot.bid_ct_04,
-                             &snapshot.bid_ct_05, &snapshot.bid_ct_06, &snapshot.bid_ct_07, &snapshot.bid_ct_08, &snapshot.bid_ct_09};
-    
-    double* ask_prices[] = {&snapshot.ask_px_00, &snapshot.ask_px_01, &snapshot.ask_px_02, &snapshot.ask_px_03, &snapshot.ask_px_04,
-                           &snapshot.ask_px_05, &snapshot.ask_px_06, &snapshot.ask_px_07, &snapshot.ask_px_08, &snapshot.ask_px_09};
+    double* bid_prices = &snapshot.bid_px_00;
+    uint64_t* bid_sizes = &snapshot.bid_sz_00;
+    uint32_t* bid_counts = &snapshot.bid_ct_00;
     
-    uint64_t* ask_sizes[] = {&snapshot.ask_sz_00, &snapshot.ask_sz_01, &snapshot.ask_sz_02, &snapshot.ask_sz_03, &snapshot.ask_sz_04,
-                            &snapshot.ask_sz_05, &snapshot.ask_sz_06, &snapshot.ask_sz_07, &snapshot.ask_sz_08, &snapshot.ask_sz_09};
-    
-    uint32_t* ask_counts[] = {&snapshot.ask_ct_00, &snapshot.ask_ct_01, &snapshot.ask_ct_02, &snapshot.ask_ct_03, &snapshot.ask_ct_04,
-                             &snapshot.ask_ct_05, &snapshot.ask_ct_06, &snapshot.ask_ct_07, &snapshot.ask_ct_08, &snapshot.ask_ct_09};
-    
-    auto bid_it = bid_levels_.begin();
-    for (int i = 0; i < 10; ++i) {
-        if (bid_it != bid_levels_.end()) {
-            *bid_prices[i] = bid_it->second.price;
-            *bid_sizes[i] = bid_it->second.total_size;
-            *bid_counts[i] = bid_it->second.order_count;
-            ++bid_it;
-        } else {
-            break;
-        }
-    }
+    double* ask_prices = &snapshot.ask_px_00;
+    uint64_t* ask_sizes = &snapshot.ask_sz_00;
+    uint32_t* ask_counts = &snapshot.ask_ct_00;
     
-    auto ask_it = ask_levels_.begin();
     for (int i = 0; i < 10; ++i) {
-        if (ask_it != ask_levels_.end()) {
-            *ask_prices[i] = ask_it->second.price;
-            *ask_sizes[i] = ask_it->second.total_size;
-            *ask_counts[i] = ask_it->second.order_count;
-            ++ask_it;
-        } else {
-            break;
-        }
+        bid_prices[i] = top10.bid_prices[i];
+        bid_sizes[i] = top10.bid_sizes[i];
+        bid_counts[i] = top10.bid_counts[i];
+        
+        ask_prices[i] = top10.ask_prices[i];
+        ask_sizes[i] = top10.ask_sizes[i];
+        ask_counts[i] = top10.ask_counts[i];
     }
     
     return snapshot;
@@ -365,7 +312,7 @@ void OrderBook::fillOrdersAtLevel(LevelData& level, uint64_t fill_size, char sid
             
             orders_.erase(front_order.order_id);
             
-            level.order_queue.pop();
+            level.order_queue.pop_front();
         } else {
             front_order.size -= remaining_fill;
             level.total_size -= remaining_fill;
@@ -381,25 +328,18 @@ void OrderBook::fillOrdersAtLevel(LevelData& level, uint64_t fill_size, char sid
 }
 
 void OrderBook::updateOrderInQueue(LevelData& level, uint64_t order_id, uint64_t cancel_size) {
-    std::queue<OrderEntry> new_queue;
-    bool order_found = false;
-    
-    while (!level.order_queue.empty()) {
-        OrderEntry entry = level.order_queue.front();
-        level.order_queue.pop();
-        
-        if (entry.order_id == order_id) {
-            order_found = true;
-            if (entry.size > cancel_size) {
-                entry.size -= cancel_size;
-                new_queue.push(entry);
-            }
-        } else {
-            new_queue.push(entry);
-        }
+    // Update the entry in place; the rest of the FIFO keeps its position
+    auto entry_it = std::find_if(level.order_queue.begin(), level.order_queue.end(),
+                                 [order_id](const OrderEntry& entry) { return entry.order_id == order_id; });
+    if (entry_it == level.order_queue.end()) {
+        return;
     }
     
-    level.order_queue = new_queue;
+    if (entry_it->size > cancel_size) {
+        entry_it->size -= cancel_size;
+    } else {
+        level.order_queue.erase(entry_it);
+    }
 }
 
 std::pair<double, double> OrderBook::getBestBidAsk() const {
@@ -23,6 +23,7 @@ void testMboParser() {
     assert(events[0].price == 5.51);
     assert(events[0].size == 100);
     assert(events[0].order_id == 817593);
+    assert(events[0].ts_event.count() == 1752739503360677248LL);
     
     assert(events[1].action == 'A');
     assert(events[1].side == 'A');
@@ -35,6 +36,7 @@ void testMboParser() {
     assert(events[2].price == 5.51);
     assert(events[2].size == 50);
     assert(events[2].order_id == 817593);
+    assert(events[2].ts_event.count() == 1752739503361327319LL);
     
     std::remove(test_filename.c_str());
     
@@ -405,6 +405,48 @@ void testTradeEventFIFO() {
     std::cout << "✓ Trade FIFO policy passed" << std::endl;
 }
 
+void testCancelKeepsQueuePriority() {
+    std::cout << "Testing Queue Priority After Partial Cancel..." << std::endl;
+    OrderBook book;
+    
+    book.addOrder(2001, 100.75, 20, 'A'); // First in queue
+    book.addOrder(2002, 100.75, 30, 'A'); // Second in queue
+    book.addOrder(2003, 100.75, 40, 'A'); // Third in queue
+    
+    // Partial cancel must not move order 2002 to the back of the queue
+    MboEvent partialCancel{std::chrono::nanoseconds(0), 'C', 'A', 100.75, 10, 2002};
+    assert(book.processEvent(partialCancel));
+    
+    MbpSnapshot snapshot1 = book.generateSnapshot();
+    assert(snapshot1.ask_sz_00 == 80);
+    assert(snapshot1.ask_ct_00 == 3);
+    
+    // Trade of 30 fills 2001 (20) and then 10 of 2002 (20 left after the cancel)
+    MboEvent trade{std::chrono::nanoseconds(0), 'T', 'B', 100.75, 30, 0};
+    assert(book.processEvent(trade));
+    MboEvent fill{std::chrono::nanoseconds(0), 'F', 'A', 100.75, 30, 2001};
+    assert(book.processEvent(fill));
+    MboEvent cancel{std::chrono::nanoseconds(0), 'C', 'A', 100.75, 30, 2001};
+    assert(book.processEvent(cancel));
+    
+    MbpSnapshot snapshot2 = book.generateSnapshot();
+    assert(snapshot2.ask_sz_00 == 50); // 10 left on 2002 + 40 on 2003
+    assert(snapshot2.ask_ct_00 == 2);
+    assert(!book.orderExists(2001));
+    assert(book.orderExists(2002));
+    assert(book.orderExists(2003));
+    
+    // Cancelling the rest of 2002 leaves only 2003 at the level
+    MboEvent fullCancel{std::chrono::nanoseconds(0), 'C', 'A', 100.75, 10, 2002};
+    assert(book.processEvent(fullCancel));
+    
+    MbpSnapshot snapshot3 = book.generateSnapshot();
+    assert(snapshot3.ask_sz_00 == 40);
+    assert(snapshot3.ask_ct_00 == 1);
+    
+    std::cout << "✓ Queue priority after partial cancel passed" << std::endl;
+}
+
 void testTradeEventIgnoreSideN() {
     std::cout << "Testing Trade Event Side 'N' Ignored..." << std::endl;
     OrderBook book;
@@ -622,6 +664,7 @@ int main() {
     testMultiOrderLevelCancellation();
     testTradeEventHandling();
     testTradeEventFIFO();
+    testCancelKeepsQueuePriority();
     testTradeEventIgnoreSideN();
     testTradeEventOppositeSideLogic();
     testResetEvent();